@@ -0,0 +1,24 @@
+import os
+from pathlib import Path
+
+from pytezos import ContractInterface
+
+michelson_dir = Path(__file__).parent.parent / "michelson"
+
+_loaded_contracts = {}
+
+
+def load_contract(name):
+    """
+    Loads a compiled contract from the michelson directory. Contracts are
+    parsed once per process and reloaded only if the file changes.
+    :param name: file name of the contract, e.g. "minter.tz"
+    :return: pytezos.ContractInterface
+    """
+    path = michelson_dir / name
+    mtime = os.path.getmtime(path)
+    loaded = _loaded_contracts.get(path)
+    if loaded is None or loaded[0] != mtime:
+        loaded = (mtime, ContractInterface.from_file(path))
+        _loaded_contracts[path] = loaded
+    return loaded[1]
@@ -1,10 +1,10 @@
 import json
-from pathlib import Path
 from typing import TypedDict
 
-from pytezos import ContractInterface, PyTezosClient
+from pytezos import PyTezosClient
 from pytezos.operation.result import OperationResult
 
+from src.contracts import load_contract
 from src.token import Token
 
 _fa2_default_meta = "ipfs://QmT4qMBAK6qqXvr9sy3zVAWxY9Xh8siyLD8uw2w1UT74GY"
@@ -68,28 +68,26 @@ class Deploy(object):
     def __init__(self, client: PyTezosClient):
         self.client = client
 
-        root_dir = Path(__file__).parent.parent / "michelson"
-        self.minter_contract = ContractInterface.from_file(root_dir / "minter.tz")
-        self.quorum_contract = ContractInterface.from_file(root_dir / "quorum.tz")
-        self.fa2_contract = ContractInterface.from_file(root_dir / "multi_asset.tz")
-        self.nft_contract = ContractInterface.from_file(root_dir / "nft.tz")
-        self.governance_contract = ContractInterface.from_file(root_dir / "governance_token.tz")
+        self.minter_contract = load_contract("minter.tz")
+        self.quorum_contract = load_contract("quorum.tz")
+        self.fa2_contract = load_contract("multi_asset.tz")
+        self.nft_contract = load_contract("nft.tz")
+        self.governance_contract = load_contract("governance_token.tz")
 
     def all(self, signers: dict[str, str], governance_token, tokens: list[TokenAndMetaType], nft: list[NftTokenAndMetaType] = [],
             threshold=1):
-        originations = [self._fa2_origination(tokens), self._governance_token_origination(governance_token)]
+        originations = [self._fa2_origination(tokens), self._governance_token_origination(governance_token),
+                        self._quorum_origination(signers, threshold)]
         originations.extend([self._nft_origination(v) for k, v in enumerate(nft)])
-        print("Deploying FA2s and nfts")
+        print("Deploying FA2s, nfts and quorum contract")
         opg = self.client.bulk(*originations).autofill().sign().inject(min_confirmations=1, _async=False)
         originated_contracts = OperationResult.originated_contracts(opg)
         for o in originated_contracts:
             _print_contract(o)
         fa2 = originated_contracts[0]
         governance = originated_contracts[1]
-        nft_contracts = dict((v["eth_contract"][2:], originated_contracts[k + 2]) for k, v in enumerate(nft))
-
-        print("Deploying quorum contract")
-        quorum = self._originate_single_contract(self._quorum_origination(signers, threshold))
+        quorum = originated_contracts[2]
+        nft_contracts = dict((v["eth_contract"][2:], originated_contracts[k + 3]) for k, v in enumerate(nft))
 
         minter = self._deploy_minter(quorum, tokens, fa2,
                                      {'tezos': governance, 'eth': governance_token}, nft_contracts)
@@ -158,11 +156,10 @@ class Deploy(object):
 
     def _fa2_origination(self, tokens, admin=None, minter=None, meta_uri=_fa2_default_meta):
         meta = _metadata_encode_uri(meta_uri)
-        token_metadata = dict(
-            [(k, {'token_id': k,
-                  'token_info': self._token_info(v)}) for k, v in
-             enumerate(tokens)])
-        supply = dict([(k, 0) for k, v in enumerate(tokens)])
+        token_metadata, supply = {}, {}
+        for k, v in enumerate(tokens):
+            token_metadata[k] = {'token_id': k, 'token_info': self._token_info(v)}
+            supply[k] = 0
         initial_storage = {
             'admin': {
                 'admin': self.client.key.public_key_hash() if admin is None else admin,
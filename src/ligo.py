@@ -1,8 +1,10 @@
+import hashlib
 import json
 import os
-from io import TextIOWrapper
+import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from subprocess import Popen, PIPE
 
 from pytezos import pytezos, ContractInterface, michelson_to_micheline
 from pytezos.operation.result import OperationResult
@@ -16,17 +18,58 @@ ligo_cmd = (
     f'ligo'
 )
 
+root_dir = Path(__file__).parent.parent
+cache_dir = root_dir / ".cache" / "ligo"
+
 
 def execute_command(command):
-    wd = Path(__file__).parent.parent
-    with Popen(command, stdout=PIPE, stderr=PIPE, shell=True, cwd=wd) as p:
-        with TextIOWrapper(p.stdout) as out, TextIOWrapper(p.stderr) as err:
-            michelson = out.read()
-            if not michelson:
-                msg = err.read()
-                raise Exception(msg)
-            else:
-                return michelson
+    result = subprocess.run(command, shell=True, cwd=root_dir, capture_output=True, text=True, check=False)
+    if not result.stdout:
+        raise Exception(result.stderr)
+    return result.stdout
+
+
+@lru_cache(maxsize=None)
+def _compiler_version():
+    return execute_command(f"{ligo_cmd} --version")
+
+
+def _sources_digest(command):
+    # contracts include files across the whole ligo tree, so every source is part of the key
+    digest = hashlib.blake2b(command.encode(), digest_size=20)
+    digest.update(_compiler_version().encode())
+    for source in sorted((root_dir / "ligo").rglob("*.mligo")):
+        content = source.read_bytes()
+        # path and length delimit each file, so moving code across files changes the key
+        digest.update(f"{source.relative_to(root_dir).as_posix()}\0{len(content)}\0".encode())
+        digest.update(content)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _cached_command(command, digest):
+    cached = cache_dir / f"{digest}.tz"
+    if cached.exists():
+        return cached.read_text()
+    michelson = execute_command(command)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # write then rename, so an interrupted or concurrent run never leaves a truncated entry
+    with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False) as tmp:
+        tmp.write(michelson)
+    os.replace(tmp.name, cached)
+    return michelson
+
+
+def compile_michelson(ligo_file, main_func):
+    """
+    Compiles a LIGO contract to Michelson, reusing the output of previous
+    compilations of the same, unmodified, sources. Results are persisted in
+    .cache/ligo so subsequent runs skip compilation. The cache key includes
+    the output of `ligo --version`, so ligo must still be available even when
+    every contract is cached.
+    """
+    command = f"{ligo_cmd} compile-contract {ligo_file} {main_func}"
+    return _cached_command(command, _sources_digest(command))
 
 
 class LigoView:
@@ -99,13 +142,14 @@ class LigoContract:
     def get_contract(self):
         """
         Returns pytezos contract. If it is not loaded et, compiles it from LIGO
-        source file.
+        source file, reusing the Michelson of a previous compilation of the
+        same sources.
         :return: pytezos.ContractInterface
         """
-        if self.contract_interface:
-            return self.contract_interface
-        else:
-            return self.compile_contract()
+        if not self.contract_interface:
+            michelson = compile_michelson(self.ligo_file, self.main_func)
+            self.contract_interface = ContractInterface.from_michelson(michelson)
+        return self.contract_interface
 
     def _ligo_to_michelson_sanitized(self, command):
         michelson = execute_command(command)
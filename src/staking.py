@@ -1,9 +1,10 @@
 import json
-from pathlib import Path
 
-from pytezos import PyTezosClient, ContractInterface
+from pytezos import PyTezosClient
 from pytezos.operation.result import OperationResult
 
+from src.contracts import load_contract
+
 default_meta_uri = "https://gist.githubusercontent.com/BodySplash/2375d86cae6abf80eee06936331f88ac/raw/staking.json"
 v2_meta_uri = "ipfs://QmRPFzh3QwToMiYaigggBK91UaM5pyChDG8gqpWLbE1MwV"
 
@@ -23,9 +24,8 @@ class Staking(object):
     def __init__(self, client: PyTezosClient):
         self.client = client
 
-        root_dir = Path(__file__).parent.parent / "michelson"
-        self.staking_contract = ContractInterface.from_file(root_dir / "staking.tz")
-        self.reserve_contract = ContractInterface.from_file(root_dir / "reserve.tz")
+        self.staking_contract = load_contract("staking.tz")
+        self.reserve_contract = load_contract("reserve.tz")
 
     def deploy_reserve(self, minter_contract, admin=None):
         admin = self.client.key.public_key_hash() if admin is None else admin
@@ -17,7 +17,7 @@ class GovernanceTokenTest(TestCase):
     @classmethod
     def compile_contract(cls):
         root_dir = Path(__file__).parent.parent / "ligo"
-        cls.contract = LigoContract(root_dir / "fa2" / "governance" / "main.mligo", "main").compile_contract()
+        cls.contract = LigoContract(root_dir / "fa2" / "governance" / "main.mligo", "main").get_contract()
 
     @classmethod
     def setUpClass(cls):
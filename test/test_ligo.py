@@ -0,0 +1,72 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src import ligo
+
+
+class CompileMichelsonTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root_dir = Path(tmp.name)
+        (self.root_dir / "ligo" / "minter").mkdir(parents=True)
+        self.main = self.root_dir / "ligo" / "minter" / "main.mligo"
+        self.main.write_text('#include "types.mligo"\nlet main = ()')
+        self.types = self.root_dir / "ligo" / "minter" / "types.mligo"
+        self.types.write_text("type storage = unit")
+
+        self.version = "0.10.0"
+        self.compilations = 0
+        for p in [patch.object(ligo, "root_dir", self.root_dir),
+                  patch.object(ligo, "cache_dir", self.root_dir / ".cache" / "ligo"),
+                  patch.object(ligo, "execute_command", self._execute_command)]:
+            p.start()
+            self.addCleanup(p.stop)
+        self._clear_caches()
+        self.addCleanup(self._clear_caches)
+
+    def _clear_caches(self):
+        ligo._compiler_version.cache_clear()
+        ligo._cached_command.cache_clear()
+
+    def _execute_command(self, command):
+        if command.endswith("--version"):
+            return self.version
+        self.compilations += 1
+        return f"michelson {self.compilations}"
+
+    def _new_process(self):
+        self._clear_caches()
+        return ligo.compile_michelson(self.main, "main")
+
+    def test_reuses_persisted_michelson(self):
+        first = self._new_process()
+
+        self.assertEqual(first, self._new_process())
+        self.assertEqual(1, self.compilations)
+
+    def test_recompiles_when_included_file_changes(self):
+        first = self._new_process()
+        self.types.write_text("type storage = nat")
+
+        self.assertNotEqual(first, self._new_process())
+        self.assertEqual(2, self.compilations)
+
+    def test_recompiles_when_code_moves_between_files(self):
+        self.main.write_text('#include "types.mligo"\nlet main = ()\n')
+        self.types.write_text("type storage = unit")
+        first = self._new_process()
+        self.main.write_text('#include "types.mligo"\n')
+        self.types.write_text("let main = ()\ntype storage = unit")
+
+        self.assertNotEqual(first, self._new_process())
+
+    def test_recompiles_when_compiler_changes(self):
+        first = self._new_process()
+        self.version = "0.11.0"
+
+        self.assertNotEqual(first, self._new_process())
+        self.assertEqual(2, self.compilations)
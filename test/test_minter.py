@@ -19,13 +19,14 @@ quorum_contract = 'KT1Qjq1Yp27QUT8s8ECRbra48pbDmfWa1u2K'
 oracle = 'KT1TDjmcU182CyFdNBpnqbecPSJDPNRBKqFZ'
 admin = Key.generate(export=False).public_key_hash()
 governance = Key.generate(export=False).public_key_hash()
+default_block_hash = bytes.fromhex("e1286c8cdafc9462534bce697cf3bf7e718c2241c6d02763e4027b072d371b7c")
 
 
 class MinterTest(TestCase):
     @classmethod
     def compile_contract(cls):
         root_dir = Path(__file__).parent.parent / "ligo"
-        cls.minter_contract = LigoContract(root_dir / "minter" / "main.mligo", "main").compile_contract()
+        cls.minter_contract = LigoContract(root_dir / "minter" / "main.mligo", "main").get_contract()
 
     @classmethod
     def setUpClass(cls):
@@ -813,7 +814,7 @@ def valid_storage(mints=None, fees_ratio=0, nft_fees=1, tokens=None, paused=Fals
 
 
 def mint_erc20_parameters(
-        block_hash=bytes.fromhex("e1286c8cdafc9462534bce697cf3bf7e718c2241c6d02763e4027b072d371b7c"),
+        block_hash=default_block_hash,
         log_index=1,
         owner=user,
         amount=2):
@@ -824,7 +825,7 @@ def mint_erc20_parameters(
             }
 
 
-def mint_erc721_parameters(block_hash=bytes.fromhex("e1286c8cdafc9462534bce697cf3bf7e718c2241c6d02763e4027b072d371b7c"),
+def mint_erc721_parameters(block_hash=default_block_hash,
                            log_index=1,
                            owner=user,
                            token_id=2):